@@ -1,7 +1,8 @@
+import uuid as uuid_module
 from argparse import Namespace
 from contextlib import contextmanager
 from typing import Optional, Union
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, call
 from uuid import uuid4
 
 import pytest
@@ -9,7 +10,13 @@ from baby_steps import given, then, when
 from rich.console import Console
 from rich.style import Style
 from vedro.core import Dispatcher
-from vedro.events import ArgParsedEvent, ScenarioFailedEvent, ScenarioRunEvent, StepFailedEvent
+from vedro.events import (
+    ArgParsedEvent,
+    ScenarioFailedEvent,
+    ScenarioRunEvent,
+    StepFailedEvent,
+    StepPassedEvent,
+)
 from vedro.plugins.director import DirectorPlugin, Reporter
 from vedro.plugins.director.rich.test_utils import (
     chose_reporter,
@@ -36,8 +43,12 @@ def reporter(dispatcher: Dispatcher, console_: Console) -> GitlabReporterPlugin:
 def patch_uuid(uuid: Optional[str] = None):
     if uuid is None:
         uuid = str(uuid4())
-    with patch("uuid.uuid4", Mock(return_value=uuid)):
+    original = uuid_module.uuid4
+    uuid_module.uuid4 = Mock(return_value=uuid)
+    try:
         yield uuid
+    finally:
+        uuid_module.uuid4 = original
 
 
 def make_parsed_args(*,
@@ -54,6 +65,14 @@ def make_parsed_args(*,
     )
 
 
+_ARGS_VERBOSE0 = make_parsed_args(verbose=0)
+_ARGS_VERBOSE1 = make_parsed_args(verbose=1)
+_ARGS_VERBOSE2 = make_parsed_args(verbose=2)
+_ARGS_COLLAPSABLE_NONE = make_parsed_args(gitlab_collapsable=None)
+_ARGS_COLLAPSABLE_STEPS = make_parsed_args(gitlab_collapsable=GitlabCollapsableMode.STEPS)
+_ARGS_COLLAPSABLE_VARS = make_parsed_args(gitlab_collapsable=GitlabCollapsableMode.VARS)
+
+
 def test_gitlab_reporter():
     with when:
         reporter = GitlabReporterPlugin(GitlabReporter)
@@ -62,7 +81,6 @@ def test_gitlab_reporter():
         assert isinstance(reporter, Reporter)
 
 
-@pytest.mark.asyncio
 async def test_reporter_scenario_run_event(*, dispatcher: Dispatcher,
                                            director: DirectorPlugin,
                                            reporter: GitlabReporterPlugin, console_: Mock):
@@ -81,11 +99,24 @@ async def test_reporter_scenario_run_event(*, dispatcher: Dispatcher,
         ]
 
 
+async def test_reporter_step_end_before_scenario_run(*, dispatcher: Dispatcher,
+                                                     director: DirectorPlugin,
+                                                     reporter: GitlabReporterPlugin):
+    with given:
+        await chose_reporter(dispatcher, director, reporter)
+        event = StepFailedEvent(make_step_result().mark_failed())
+
+    with when, pytest.raises(BaseException) as exc_info:
+        await dispatcher.fire(event)
+
+    with then:
+        assert exc_info.type is RuntimeError
+
+
 @pytest.mark.parametrize("args", [
-    make_parsed_args(verbose=0),  # backward compatibility
-    make_parsed_args(gitlab_collapsable=None),
+    _ARGS_VERBOSE0,  # backward compatibility
+    _ARGS_COLLAPSABLE_NONE,
 ])
-@pytest.mark.asyncio
 async def test_reporter_scenario_failed_event_verbose0(args: Namespace, *,
                                                        dispatcher: Dispatcher,
                                                        director: DirectorPlugin,
@@ -108,10 +139,9 @@ async def test_reporter_scenario_failed_event_verbose0(args: Namespace, *,
 
 
 @pytest.mark.parametrize("args", [
-    make_parsed_args(verbose=1),  # backward compatibility
-    make_parsed_args(gitlab_collapsable=GitlabCollapsableMode.STEPS),
+    _ARGS_VERBOSE1,  # backward compatibility
+    _ARGS_COLLAPSABLE_STEPS,
 ])
-@pytest.mark.asyncio
 async def test_reporter_scenario_failed_event_verbose1(args: Namespace, *,
                                                        dispatcher: Dispatcher,
                                                        director: DirectorPlugin,
@@ -139,10 +169,9 @@ async def test_reporter_scenario_failed_event_verbose1(args: Namespace, *,
 
 
 @pytest.mark.parametrize("args", [
-    make_parsed_args(verbose=2),  # backward compatibility
-    make_parsed_args(gitlab_collapsable=GitlabCollapsableMode.VARS),
+    _ARGS_VERBOSE2,  # backward compatibility
+    _ARGS_COLLAPSABLE_VARS,
 ])
-@pytest.mark.asyncio
 async def test_reporter_scenario_failed_event_verbose2(args: Namespace, *,
                                                        dispatcher: Dispatcher,
                                                        director: DirectorPlugin,
@@ -154,7 +183,7 @@ async def test_reporter_scenario_failed_event_verbose2(args: Namespace, *,
 
         scenario_result = make_scenario_result()
         await dispatcher.fire(ScenarioRunEvent(scenario_result))
-        console_.reset_mock()
+        calls_before = len(console_.mock_calls)
 
         scenario_result.set_scope({"key": "val"})
         step_result = make_step_result().mark_failed()
@@ -168,7 +197,7 @@ async def test_reporter_scenario_failed_event_verbose2(args: Namespace, *,
         await dispatcher.fire(event)
 
     with then:
-        assert console_.mock_calls == [
+        assert console_.mock_calls[calls_before:] == [
             call.out(f" ✗ {scenario_result.scenario.subject}", style=Style.parse("red")),
             call.out(f"    ✗ {step_result.step_name}", style=Style.parse("red")),
             call.file.write(f"\x1b[0Ksection_start:0:{uuid}[collapsed=true]\r\x1b[0K"),
@@ -176,3 +205,141 @@ async def test_reporter_scenario_failed_event_verbose2(args: Namespace, *,
             call.out("\"val\""),
             call.file.write(f"\x1b[0Ksection_end:0:{uuid}\r\x1b[0K")
         ]
+
+
+async def test_reporter_scenario_failed_event_vars_grouped_by_step(*, dispatcher: Dispatcher,
+                                                                   director: DirectorPlugin,
+                                                                   reporter: GitlabReporterPlugin,
+                                                                   console_: Mock):
+    with given:
+        await chose_reporter(dispatcher, director, reporter)
+        await dispatcher.fire(ArgParsedEvent(_ARGS_COLLAPSABLE_VARS))
+
+        scenario_result = make_scenario_result()
+        await dispatcher.fire(ScenarioRunEvent(scenario_result))
+        calls_before = len(console_.mock_calls)
+
+        scenario_result.set_scope({"first": 1})
+        first_step_result = make_step_result().mark_passed()
+        await dispatcher.fire(StepPassedEvent(first_step_result))
+
+        scenario_result.set_scope({"first": 1, "second": 2})
+        second_step_result = make_step_result().mark_failed()
+        await dispatcher.fire(StepFailedEvent(second_step_result))
+
+        scenario_result = scenario_result.mark_failed()
+        scenario_result.add_step_result(first_step_result)
+        scenario_result.add_step_result(second_step_result)
+        event = ScenarioFailedEvent(scenario_result)
+
+    with when, patch_uuid() as uuid:
+        await dispatcher.fire(event)
+
+    with then:
+        assert console_.mock_calls[calls_before:] == [
+            call.out(f" ✗ {scenario_result.scenario.subject}", style=Style.parse("red")),
+            call.out(f"    ✔ {first_step_result.step_name}", style=Style.parse("green")),
+            call.file.write(f"\x1b[0Ksection_start:0:{uuid}[collapsed=true]\r\x1b[0K"),
+            call.out("      first: ", style=Style.parse("blue")),
+            call.out("1"),
+            call.file.write(f"\x1b[0Ksection_end:0:{uuid}\r\x1b[0K"),
+            call.out(f"    ✗ {second_step_result.step_name}", style=Style.parse("red")),
+            call.file.write(f"\x1b[0Ksection_start:0:{uuid}[collapsed=true]\r\x1b[0K"),
+            call.out("      second: ", style=Style.parse("blue")),
+            call.out("2"),
+            call.file.write(f"\x1b[0Ksection_end:0:{uuid}\r\x1b[0K"),
+        ]
+
+
+async def test_reporter_scenario_failed_event_scope_key_deleted(*, dispatcher: Dispatcher,
+                                                                director: DirectorPlugin,
+                                                                reporter: GitlabReporterPlugin,
+                                                                console_: Mock):
+    with given:
+        await chose_reporter(dispatcher, director, reporter)
+        await dispatcher.fire(ArgParsedEvent(_ARGS_COLLAPSABLE_VARS))
+
+        scenario_result = make_scenario_result()
+        await dispatcher.fire(ScenarioRunEvent(scenario_result))
+        calls_before = len(console_.mock_calls)
+
+        scope = {"first": 1, "second": 2}
+        scenario_result.set_scope(scope)
+        first_step_result = make_step_result().mark_passed()
+        await dispatcher.fire(StepPassedEvent(first_step_result))
+
+        del scope["first"]
+        scope["third"] = 3
+        second_step_result = make_step_result().mark_failed()
+        await dispatcher.fire(StepFailedEvent(second_step_result))
+
+        scenario_result = scenario_result.mark_failed()
+        scenario_result.add_step_result(first_step_result)
+        scenario_result.add_step_result(second_step_result)
+        event = ScenarioFailedEvent(scenario_result)
+
+    with when, patch_uuid() as uuid:
+        await dispatcher.fire(event)
+
+    with then:
+        assert console_.mock_calls[calls_before:] == [
+            call.out(f" ✗ {scenario_result.scenario.subject}", style=Style.parse("red")),
+            call.out(f"    ✔ {first_step_result.step_name}", style=Style.parse("green")),
+            call.file.write(f"\x1b[0Ksection_start:0:{uuid}[collapsed=true]\r\x1b[0K"),
+            call.out("      second: ", style=Style.parse("blue")),
+            call.out("2"),
+            call.file.write(f"\x1b[0Ksection_end:0:{uuid}\r\x1b[0K"),
+            call.out(f"    ✗ {second_step_result.step_name}", style=Style.parse("red")),
+            call.file.write(f"\x1b[0Ksection_start:0:{uuid}[collapsed=true]\r\x1b[0K"),
+            call.out("      third: ", style=Style.parse("blue")),
+            call.out("3"),
+            call.file.write(f"\x1b[0Ksection_end:0:{uuid}\r\x1b[0K"),
+        ]
+
+
+async def test_reporter_scenario_failed_event_scope_key_readded(*, dispatcher: Dispatcher,
+                                                                director: DirectorPlugin,
+                                                                reporter: GitlabReporterPlugin,
+                                                                console_: Mock):
+    with given:
+        await chose_reporter(dispatcher, director, reporter)
+        await dispatcher.fire(ArgParsedEvent(_ARGS_COLLAPSABLE_VARS))
+
+        scenario_result = make_scenario_result()
+        await dispatcher.fire(ScenarioRunEvent(scenario_result))
+        calls_before = len(console_.mock_calls)
+
+        scope = {"key": 1}
+        scenario_result.set_scope(scope)
+        step_results = [make_step_result().mark_passed() for _ in range(3)]
+        await dispatcher.fire(StepPassedEvent(step_results[0]))
+
+        del scope["key"]
+        await dispatcher.fire(StepPassedEvent(step_results[1]))
+
+        scope["key"] = 2
+        await dispatcher.fire(StepPassedEvent(step_results[2]))
+
+        scenario_result = scenario_result.mark_failed()
+        for step_result in step_results:
+            scenario_result.add_step_result(step_result)
+        event = ScenarioFailedEvent(scenario_result)
+
+    with when, patch_uuid() as uuid:
+        await dispatcher.fire(event)
+
+    with then:
+        assert console_.mock_calls[calls_before:] == [
+            call.out(f" ✗ {scenario_result.scenario.subject}", style=Style.parse("red")),
+            call.out(f"    ✔ {step_results[0].step_name}", style=Style.parse("green")),
+            call.file.write(f"\x1b[0Ksection_start:0:{uuid}[collapsed=true]\r\x1b[0K"),
+            call.out("      key: ", style=Style.parse("blue")),
+            call.out("2"),
+            call.file.write(f"\x1b[0Ksection_end:0:{uuid}\r\x1b[0K"),
+            call.out(f"    ✔ {step_results[1].step_name}", style=Style.parse("green")),
+            call.out(f"    ✔ {step_results[2].step_name}", style=Style.parse("green")),
+            call.file.write(f"\x1b[0Ksection_start:0:{uuid}[collapsed=true]\r\x1b[0K"),
+            call.out("      key: ", style=Style.parse("blue")),
+            call.out("2"),
+            call.file.write(f"\x1b[0Ksection_end:0:{uuid}\r\x1b[0K"),
+        ]
@@ -1,7 +1,7 @@
 import uuid
 import warnings
 from enum import Enum
-from typing import Any, Dict, Set, Type, Union
+from typing import Any, Dict, List, Set, Tuple, Type, Union
 
 from rich.style import Style
 from vedro.core import Dispatcher, ScenarioResult
@@ -16,6 +16,13 @@ from vedro.plugins.director import DirectorInitEvent, RichReporter, RichReporter
 
 __all__ = ("GitlabReporter", "GitlabReporterPlugin", "GitlabCollapsableMode",)
 
+_BLUE_STYLE = Style(color="blue")
+_NO_VARS: Tuple[Tuple[str, str], ...] = ()
+_ERASE_LINE = "\033[0K"
+_SECTION_START = f"{_ERASE_LINE}section_start:"
+_SECTION_END = f"{_ERASE_LINE}section_end:"
+_SECTION_TAIL = f"\r{_ERASE_LINE}"
+
 
 class GitlabCollapsableMode(Enum):
     STEPS = "steps"
@@ -42,8 +49,9 @@ class GitlabReporterPlugin(RichReporterPlugin):
     def on_chosen(self) -> None:
         assert isinstance(self._dispatcher, Dispatcher)
         super().on_chosen()
-        self._dispatcher.listen(StepPassedEvent, self.on_step_end) \
-                        .listen(StepFailedEvent, self.on_step_end)
+        on_step_end = self.on_step_end
+        self._dispatcher.listen(StepPassedEvent, on_step_end) \
+                        .listen(StepFailedEvent, on_step_end)
 
     def on_arg_parse(self, event: ArgParseEvent) -> None:
         super().on_arg_parse(event)
@@ -81,16 +89,16 @@ class GitlabReporterPlugin(RichReporterPlugin):
         self._prev_scope = set()
 
     def on_step_end(self, event: Union[StepPassedEvent, StepFailedEvent]) -> None:
-        assert isinstance(self._scenario_result, ScenarioResult)
+        scenario_result = self._scenario_result
+        if scenario_result is None:
+            raise RuntimeError("GitlabReporterPlugin: step ended before scenario run")
 
         step_name = event.step_result.step_name
-        if self._scenario_result.scope:
-            step_scope = set(self._scenario_result.scope.keys())
-        else:
-            step_scope = set()
+        # scope is the scenario's live __dict__, so keys can be deleted as well as added
+        step_scope = scenario_result.scope.keys()
 
         self._scenario_steps[step_name] = step_scope - self._prev_scope
-        self._prev_scope = step_scope
+        self._prev_scope = set(step_scope)
         self._prev_step_name = step_name
 
     def _print_scenario_failed(self, scenario_result: ScenarioResult, *, indent: int = 0) -> None:
@@ -112,11 +120,11 @@ class GitlabReporterPlugin(RichReporterPlugin):
     def _print_section_start(self, name: str, started_at: int = 0,
                              is_collapsed: bool = True) -> None:
         collapsed = "true" if is_collapsed else "false"
-        output = f'\033[0Ksection_start:{started_at}:{name}[collapsed={collapsed}]\r\033[0K'
+        output = f"{_SECTION_START}{started_at}:{name}[collapsed={collapsed}]{_SECTION_TAIL}"
         self._console.file.write(output)
 
     def _print_section_end(self, name: str, ended_at: int = 0) -> None:
-        output = f'\033[0Ksection_end:{ended_at}:{name}\r\033[0K'
+        output = f"{_SECTION_END}{ended_at}:{name}{_SECTION_TAIL}"
         self._console.file.write(output)
 
     def _print_steps(self, scenario_result: ScenarioResult, *, indent: int = 0) -> None:
@@ -125,39 +133,58 @@ class GitlabReporterPlugin(RichReporterPlugin):
 
     def _print_exceptions(self, scenario_result: ScenarioResult) -> None:
         for step_result in scenario_result.step_results:
-            if step_result.exc_info:
-                self._print_exception(step_result.exc_info.value,
-                                      step_result.exc_info.traceback)
+            exc_info = step_result.exc_info
+            if exc_info is not None:
+                self._print_exception(exc_info.value, exc_info.traceback)
+
+    def _group_scope_by_step(self,
+                             scenario_result: ScenarioResult) -> Dict[str, List[Tuple[str, str]]]:
+        grouped: Dict[str, List[Tuple[str, str]]] = {}
+        scope = scenario_result.scope
+        if not scope:
+            return grouped
+
+        formatted = dict(self._format_scope(scope))
+        positions = {key: index for index, key in enumerate(formatted)}
+        for step_name, keys in self._scenario_steps.items():
+            step_keys = sorted((key for key in keys if key in positions),
+                               key=positions.__getitem__)
+            grouped[step_name] = [(key, formatted[key]) for key in step_keys]
+        return grouped
 
     def _print_collapsable_steps(self, scenario_result: ScenarioResult, *,
                                  indent: int = 0) -> None:
+        grouped_scope = self._group_scope_by_step(scenario_result)
+        key_prefix = f"{indent * ' '}  "
+        console_out = self._console.out
         for step_result in scenario_result.step_results:
             section_name = str(uuid.uuid4())
-            started_at = int(step_result.started_at) if step_result.started_at else 0
+            started_at = int(step_result.started_at or 0)
             self._print_section_start(section_name, started_at)
 
             self._print_step_name(step_result, indent=indent)
 
-            for key, val in self._format_scope(scenario_result.scope):
-                if key in self._scenario_steps[step_result.step_name]:
-                    self._console.out(f"{indent * ' '}  {key}: ", style=Style(color="blue"))
-                    self._console.out(val)
+            for key, val in grouped_scope.get(step_result.step_name, _NO_VARS):
+                console_out(f"{key_prefix}{key}: ", style=_BLUE_STYLE)
+                console_out(val)
 
-            ended_at = int(step_result.ended_at) if step_result.ended_at else 0
+            ended_at = int(step_result.ended_at or 0)
             self._print_section_end(section_name, ended_at)
 
     def _print_steps_with_collapsable_scope(self, scenario_result: ScenarioResult, *,
                                             indent: int = 0) -> None:
+        grouped_scope = self._group_scope_by_step(scenario_result)
+        key_prefix = f"{indent * ' '}  "
+        console_out = self._console.out
         for step_result in scenario_result.step_results:
             self._print_step_name(step_result, indent=indent)
 
-            for key, val in self._format_scope(scenario_result.scope):
-                if key in self._scenario_steps[step_result.step_name]:
-                    section_name = str(uuid.uuid4())
-                    self._print_section_start(section_name)
-                    self._console.out(f"{indent * ' '}  {key}: ", style=Style(color="blue"))
-                    self._console.out(val)
-                    self._print_section_end(section_name)
+            for key, val in grouped_scope.get(step_result.step_name, _NO_VARS):
+                section_name = str(uuid.uuid4())
+                self._print_section_start(section_name)
+                console_out(f"{key_prefix}{key}: ", style=_BLUE_STYLE)
+                console_out(val)
+                self._print_section_end(section_name)
 
     def _print_collapsable_scope(self, scenario_result: ScenarioResult) -> None:
         section_name = str(uuid.uuid4())